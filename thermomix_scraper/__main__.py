@@ -29,6 +29,7 @@ Environment variables (override with CLI args):
   THERMOMIX_OUTPUT      Output directory (default: /data)
   THERMOMIX_MODE        Run mode (skip/update/redownload/continue)
   THERMOMIX_RECIPE_IDS  Comma-separated recipe IDs
+  THERMOMIX_WORKERS     Download browsers in total (default: 1)
   THERMOMIX_DEBUG       Enable debug logging (1/true)
 """,
     )
@@ -65,6 +66,11 @@ Environment variables (override with CLI args):
         dest="recipe_ids",
         help="Specific recipe ID(s) to download (can repeat)",
     )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        help="Number of download browsers in total (default: 1)",
+    )
     parser.add_argument(
         "--headless",
         action="store_true",
@@ -94,19 +100,24 @@ def main() -> int:
         config.locale = args.locale
     if args.output:
         config.output_dir = args.output
+        # Derived from output_dir; re-derived below
+        config.state_file = None
+        config.algolia_cache_file = None
     if args.username:
         config.username = args.username
     if args.password:
         config.password = args.password
     if args.recipe_ids:
         config.recipe_ids = args.recipe_ids
+    if args.workers is not None:
+        config.download_workers = max(1, args.workers)
     if args.headless is not None:
         config.headless = args.headless
     if args.debug:
         config.debug = True
     
-    # Re-initialize paths
-    config.__post_init__()
+    # Re-derive paths after overrides
+    config._normalize_paths()
     
     # Setup logging
     log = setup_logging(config)
@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
-import json
+import html
 import logging
-from collections import deque
-from typing import TYPE_CHECKING, Generator
-from urllib.request import Request, urlopen
+import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Generator, Sequence
+from urllib.parse import urlencode
 
-from bs4 import BeautifulSoup
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from . import jsonio
 
 if TYPE_CHECKING:
     from selenium.webdriver.chrome.webdriver import WebDriver
@@ -17,34 +25,65 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("thermomix.algolia")
 
+_NEXT_DATA_RE = re.compile(r'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
 
 class AlgoliaClient:
     """Client for Cookidoo's Algolia search backend."""
     
     # Characters for prefix-based discovery
-    SEARCH_CHARS = list("ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÜabcdefghijklmnopqrstuvwxyzäöü0123456789")
+    SEARCH_CHARS = tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÜabcdefghijklmnopqrstuvwxyzäöü0123456789")
     MAX_DEPTH = 3
     HITS_PER_PAGE = 1000
+    BATCH_SIZE = 25  # Prefix queries per multi-query request
     
     def __init__(self, config: Config):
         self.config = config
         self.endpoint: str | None = None
+        self.index_name: str | None = None
         self.app_id: str | None = None
         self.api_key: str | None = None
         self.lang_filter: str | None = None
+        self.index_updated_at: str | None = None  # Index version, when the key may list indices
+        self._headers: dict[str, str] = {}
+        self.failed_queries = 0
+        
+        # Prefix query cache, persisted to config.algolia_cache_file
+        self._cache: dict[str, dict] = {}
+        self._cache_lock = threading.Lock()
+        self._queries_since_flush = 0
+        self._cache_hits = 0  # Prefixes answered from cache instead of a live query
+        
+        # IDs from the last complete walk, keyed by the index's updatedAt. Stored in
+        # the cache file so it outlives the state database, which is cleared after a clean run
+        self._snapshot: dict | None = None
+        
+        # Keep-alive connection pool shared by all prefix queries
+        self._session = requests.Session()
+        retries = Retry(
+            total=config.max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+        )
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
     
     def initialize(self, driver: WebDriver) -> None:
         """Initialize Algolia config from the search page."""
         search_url = f"{self.config.base_url}search/"
         driver.get(search_url)
         
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        next_data = soup.select_one("script#__NEXT_DATA__")
+        m = _NEXT_DATA_RE.search(driver.page_source)
+        raw = m.group(1).strip() if m else ""
         
-        if not next_data or not next_data.string:
+        if not raw:
             raise RuntimeError("Missing __NEXT_DATA__ on search page")
         
-        data = json.loads(next_data.string)
+        try:
+            data = jsonio.loads(raw)
+        except ValueError:
+            # Script contents are normally raw JSON; only decode entities if that fails
+            data = jsonio.loads(html.unescape(raw))
         props = (data.get("props") or {}).get("pageProps") or {}
         
         self.app_id = props.get("algoliaAppId")
@@ -58,81 +97,257 @@ class AlgoliaClient:
         if not all([self.app_id, self.api_key, index_name]):
             raise RuntimeError("Incomplete Algolia configuration")
         
-        self.endpoint = f"https://{self.app_id}-dsn.algolia.net/1/indexes/{index_name}/query"
+        self.index_name = index_name
+        self.endpoint = f"https://{self.app_id}-dsn.algolia.net/1/indexes/*/queries"
+        self._headers = {
+            "Content-Type": "application/json",
+            "X-Algolia-Application-Id": str(self.app_id),
+            "X-Algolia-API-Key": str(self.api_key),
+        }
         
         lang_code = self.config.locale.split("-")[0]
         self.lang_filter = f"language:{lang_code}"
         
+        # Cached prefix results are scoped to this version of the index
+        self.index_updated_at = self.get_index_updated_at()
+        self._load_cache()
+        
         log.info(f"Algolia initialized: index={index_name}, filter={self.lang_filter}")
     
+    def get_index_updated_at(self) -> str | None:
+        """Return the recipe index's updatedAt timestamp, or None if the key can't list indices."""
+        try:
+            resp = self._session.get(
+                f"https://{self.app_id}.algolia.net/1/indexes",
+                headers=self._headers,
+                timeout=self.config.request_timeout,
+            )
+            resp.raise_for_status()
+            for item in jsonio.loads(resp.content).get("items") or []:
+                if item.get("name") == self.index_name:
+                    return item.get("updatedAt")
+        except Exception as e:
+            log.debug(f"Could not read index updatedAt: {e}")
+        return None
+    
     def discover_all(self) -> Generator[str, None, None]:
         """
         Discover all recipe IDs using BFS prefix subdivision.
         
-        Yields recipe IDs as they're discovered to enable concurrent downloading.
+        Prefixes are sent in multi-query batches that run concurrently on a
+        thread pool; recipe IDs are yielded as they're discovered to enable
+        concurrent downloading. If the index hasn't changed since the last
+        complete walk, that walk's IDs are replayed without any search queries.
         """
         if not self.endpoint:
             raise RuntimeError("Algolia client not initialized")
         
-        prefix_queue = deque(self.SEARCH_CHARS)
-        seen_ids: set[str] = set()
+        updated_at = self.index_updated_at
+        snapshot = self._snapshot or {}
+        if updated_at and snapshot.get("updated_at") == updated_at and snapshot.get("scope") == self._cache_key(""):
+            log.info(f"Algolia index unchanged since {updated_at}, reusing {len(snapshot['ids'])} known recipes")
+            yield from snapshot["ids"]
+            return
+        
+        discovered: list[str] | None = None
+        if updated_at:
+            # The stored snapshot is stale; collect its replacement during the walk
+            self._snapshot = None
+            discovered = []
+        failed_before = self.failed_queries
+        hits_before = self._cache_hits
+        
+        search_chars = self.SEARCH_CHARS
+        # Dedup on string hashes; a 64-bit collision is vanishingly unlikely at this scale
+        seen_hashes: set[int] = set()
+        executor = ThreadPoolExecutor(max_workers=self.config.algolia_workers)
         
-        while prefix_queue:
-            prefix = prefix_queue.popleft()
-            ids, total_hits = self._query_prefix(prefix)
+        try:
+            pending: dict = {}
+            self._submit_batches(executor, pending, search_chars)
             
-            for rid in ids:
-                if rid not in seen_ids:
-                    seen_ids.add(rid)
-                    yield rid
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                children: list[str] = []
+                
+                for future in done:
+                    prefixes = pending.pop(future)
+                    
+                    for prefix, (ids, total_hits) in zip(prefixes, future.result()):
+                        for rid in ids:
+                            h = hash(rid)
+                            if h not in seen_hashes:
+                                seen_hashes.add(h)
+                                if discovered is not None:
+                                    discovered.append(rid)
+                                yield rid
+                        
+                        # Subdivide if we hit the limit and there are more results
+                        if len(ids) >= self.HITS_PER_PAGE and total_hits > self.HITS_PER_PAGE:
+                            if len(prefix) < self.MAX_DEPTH:
+                                children.extend(prefix + c for c in search_chars)
+                        
+                        if len(prefix) == 1:
+                            log.debug(f"Prefix '{prefix}': found {len(ids)}/{total_hits}, total discovered: {len(seen_hashes)}")
+                
+                self._submit_batches(executor, pending, children)
             
-            # Subdivide if we hit the limit and there are more results
-            if len(ids) >= self.HITS_PER_PAGE and total_hits > self.HITS_PER_PAGE:
-                if len(prefix) < self.MAX_DEPTH:
-                    for c in self.SEARCH_CHARS:
-                        prefix_queue.append(prefix + c)
+            # Only a walk answered entirely by live queries is trusted for future replays
+            all_live = self.failed_queries == failed_before and self._cache_hits == hits_before
+            if discovered is not None and all_live:
+                self._store_snapshot(updated_at, discovered)
+        
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _store_snapshot(self, updated_at: str, ids: list[str]) -> None:
+        """Remember a complete walk's IDs and write them to the cache file."""
+        with self._cache_lock:
+            self._snapshot = {"scope": self._cache_key(""), "updated_at": updated_at, "ids": ids}
+            self._flush_cache()
+    
+    def _submit_batches(self, executor: ThreadPoolExecutor, pending: dict, prefixes: Sequence[str]) -> None:
+        """Split prefixes into multi-query batches and schedule them."""
+        for i in range(0, len(prefixes), self.BATCH_SIZE):
+            batch = prefixes[i:i + self.BATCH_SIZE]
+            pending[executor.submit(self._query_batch_throttled, batch)] = batch
+    
+    def _query_batch_throttled(self, prefixes: list[str]) -> list[tuple[list[str], int]]:
+        """Resolve a prefix batch from cache, querying Algolia only for misses."""
+        results = {p: self._cache_get(p) for p in prefixes}
+        misses = [p for p, r in results.items() if r is None]
+        
+        if len(misses) < len(prefixes):
+            with self._cache_lock:
+                self._cache_hits += len(prefixes) - len(misses)
+        
+        if misses:
+            fetched = self._query_prefixes_batch(misses)
+            if fetched is None:
+                fetched = [([], 0) for _ in misses]
+            else:
+                self._cache_put(dict(zip(misses, fetched)))
+            results.update(zip(misses, fetched))
             
-            if len(prefix) == 1:
-                log.debug(f"Prefix '{prefix}': found {len(ids)}/{total_hits}, total discovered: {len(seen_ids)}")
+            # Pause this worker to respect the Algolia rate limit
+            time.sleep(self.config.algolia_delay)
+        
+        return [results[p] for p in prefixes]
     
-    def _query_prefix(self, prefix: str) -> tuple[list[str], int]:
-        """Query Algolia for recipes matching prefix."""
+    def _query_prefixes_batch(self, prefixes: list[str]) -> list[tuple[list[str], int]] | None:
+        """Query Algolia for several prefixes in one multi-query request. Returns None on failure."""
         payload = {
-            "query": prefix,
-            "page": 0,
-            "hitsPerPage": self.HITS_PER_PAGE,
-            "attributesToRetrieve": ["id"],
-            "filters": self.lang_filter,
-            "restrictSearchableAttributes": ["title"],
+            "requests": [
+                {
+                    "indexName": self.index_name,
+                    "params": urlencode({
+                        "query": prefix,
+                        "page": 0,
+                        "hitsPerPage": self.HITS_PER_PAGE,
+                        "attributesToRetrieve": '["id"]',
+                        "filters": self.lang_filter,
+                        "restrictSearchableAttributes": '["title"]',
+                    }),
+                }
+                for prefix in prefixes
+            ],
         }
         
-        req = Request(
-            self.endpoint,
-            data=json.dumps(payload).encode("utf-8"),
-            method="POST",
-            headers={
-                "Content-Type": "application/json",
-                "X-Algolia-Application-Id": str(self.app_id),
-                "X-Algolia-API-Key": str(self.api_key),
-            },
-        )
-        
         try:
-            with urlopen(req, timeout=self.config.request_timeout) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
+            resp = self._session.post(
+                self.endpoint,
+                data=jsonio.dumps(payload),
+                headers=self._headers,
+                timeout=self.config.request_timeout,
+            )
+            resp.raise_for_status()
+            results = jsonio.loads(resp.content).get("results") or []
             
-            total_hits = data.get("nbHits") or 0
-            hits = data.get("hits") or []
+            if len(results) != len(prefixes):
+                raise ValueError(f"expected {len(prefixes)} results, got {len(results)}")
+            
+            return [self._parse_result(r) for r in results]
+        
+        except Exception as e:
+            self.failed_queries += 1
+            log.warning(f"Algolia batch query failed for prefixes {prefixes[0]!r}..{prefixes[-1]!r}: {e}")
+            return None
+    
+    @staticmethod
+    def _parse_result(data: dict) -> tuple[list[str], int]:
+        """Extract recipe IDs and total hit count from a single query result."""
+        total_hits = data.get("nbHits") or 0
+        hits = data.get("hits") or []
+        
+        ids = []
+        for hit in hits:
+            if isinstance(hit, dict):
+                rid = hit.get("id") or hit.get("objectID")
+                if isinstance(rid, str) and rid.strip():
+                    ids.append(rid.strip())
+        
+        return ids, total_hits
+    
+    def _cache_key(self, prefix: str) -> str:
+        """Cache key scoped to the current index, its version and the language filter."""
+        return f"{self.index_name}@{self.index_updated_at or ''}|{self.lang_filter}|{prefix}"
+    
+    def _cache_get(self, prefix: str) -> tuple[list[str], int] | None:
+        """Return cached result for prefix if present and not expired."""
+        entry = self._cache.get(self._cache_key(prefix))
+        if not entry or time.time() - entry["ts"] > self.config.algolia_cache_ttl:
+            return None
+        return entry["ids"], entry["total"]
+    
+    def _cache_put(self, results: dict[str, tuple[list[str], int]]) -> None:
+        """Store query results and periodically flush the cache to disk."""
+        now = time.time()
+        with self._cache_lock:
+            for prefix, (ids, total_hits) in results.items():
+                self._cache[self._cache_key(prefix)] = {"ids": ids, "total": total_hits, "ts": now}
             
-            ids = []
-            for hit in hits:
-                if isinstance(hit, dict):
-                    rid = hit.get("id") or hit.get("objectID")
-                    if isinstance(rid, str) and rid.strip():
-                        ids.append(rid.strip())
+            self._queries_since_flush += 1
+            if self._queries_since_flush >= self.config.save_interval:
+                self._flush_cache()
+    
+    def _load_cache(self) -> None:
+        """Load unexpired prefix results and the last walk's snapshot from the cache file."""
+        from .config import RunMode
+        
+        path = self.config.algolia_cache_file
+        if not path or not path.exists() or self.config.mode == RunMode.REDOWNLOAD_ALL:
+            return
+        
+        try:
+            with open(path, "rb") as f:
+                data = jsonio.loads(f.read())
             
-            return ids, total_hits
+            cutoff = time.time() - self.config.algolia_cache_ttl
+            queries = data.get("queries") or {}
+            self._cache = {k: v for k, v in queries.items() if v.get("ts", 0) >= cutoff}
+            self._snapshot = data.get("snapshot")
+            log.info(f"Loaded {len(self._cache)} cached Algolia queries")
+        except Exception as e:
+            log.warning(f"Failed to load Algolia cache: {e}")
+    
+    def _flush_cache(self) -> None:
+        """Write the cache file atomically. Caller must hold the cache lock."""
+        path = self.config.algolia_cache_file
+        self._queries_since_flush = 0
+        if not path:
+            return
         
+        try:
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                f.write(jsonio.dumps({"queries": self._cache, "snapshot": self._snapshot}))
+            os.replace(tmp, path)
         except Exception as e:
-            log.warning(f"Algolia query failed for prefix='{prefix}': {e}")
-            return [], 0
+            log.warning(f"Failed to save Algolia cache: {e}")
+    
+    def close(self) -> None:
+        """Flush the query cache and release pooled HTTP connections."""
+        if self._queries_since_flush:
+            with self._cache_lock:
+                self._flush_cache()
+        self._session.close()
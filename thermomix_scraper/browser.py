@@ -4,13 +4,13 @@ from __future__ import annotations
 
 import logging
 import os
-import time
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Generator
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -24,6 +24,34 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("thermomix.browser")
 
+# Poll interval for explicit waits (Selenium defaults to 0.5s)
+_POLL_INTERVAL = 0.1
+_PAGE_POLL_INTERVAL = 0.2
+
+# Element locators
+_PAGE_READY_LOCATOR = (
+    By.CSS_SELECTOR,
+    "#ingredients li, .core-ingredient, [class*='ingredient'], script[type='application/ld+json']",
+)
+_COOKIE_BANNER_LOCATOR = (By.CLASS_NAME, "accept-cookie-container")
+_USER_PROFILE_LOCATOR = (By.TAG_NAME, "core-user-profile")
+_PASSWORD_INPUT_LOCATOR = (By.CSS_SELECTOR, 'input[type="password"]')
+_SUBMIT_LOCATOR = (By.CSS_SELECTOR, 'button[type="submit"], input[type="submit"]')
+
+_EMAIL_INPUT_SELECTORS = (
+    'input[type="email"]',
+    'input[name="email"]',
+    'input[name="username"]',
+    'input[id*="email" i]',
+    'input[id*="user" i]',
+)
+_PASSWORD_INPUT_SELECTORS = (
+    'input[type="password"]',
+    'input[name="password"]',
+    'input[name*="pass" i]',
+    'input[id*="pass" i]',
+)
+
 
 def create_driver(config: Config) -> WebDriver:
     """Create and configure Chrome WebDriver."""
@@ -37,8 +65,26 @@ def create_driver(config: Config) -> WebDriver:
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
     
+    # Return from driver.get() at DOMContentLoaded and skip assets we never parse
+    options.page_load_strategy = "eager"
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    
     service = Service(str(config.chromedriver_path))
-    return webdriver.Chrome(service=service, options=options)
+    driver = webdriver.Chrome(service=service, options=options)
+    
+    # Block trackers and web fonts before any page fires them
+    if config.blocked_url_patterns:
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": config.blocked_url_patterns})
+        except Exception as e:
+            log.debug(f"URL blocking unavailable: {e}")
+    
+    return driver
 
 
 @contextmanager
@@ -54,11 +100,17 @@ def browser_session(config: Config) -> Generator[WebDriver, None, None]:
             pass
 
 
-def dismiss_cookie_banner(driver: WebDriver) -> None:
-    """Dismiss cookie consent banner if present."""
+def dismiss_cookie_banner(driver: WebDriver, timeout: float = 0.0) -> None:
+    """Dismiss cookie consent banner if present, waiting up to timeout for it to appear."""
     try:
-        driver.find_element(By.CLASS_NAME, "accept-cookie-container").click()
-        time.sleep(0.3)
+        if timeout:
+            banner = WebDriverWait(driver, timeout, poll_frequency=_POLL_INTERVAL).until(
+                EC.element_to_be_clickable(_COOKIE_BANNER_LOCATOR)
+            )
+        else:
+            banner = driver.find_element(*_COOKIE_BANNER_LOCATOR)
+        banner.click()
+        WebDriverWait(driver, 1.0, poll_frequency=_POLL_INTERVAL).until(EC.invisibility_of_element(banner))
     except Exception:
         pass
 
@@ -66,11 +118,8 @@ def dismiss_cookie_banner(driver: WebDriver) -> None:
 def wait_for_page_load(driver: WebDriver, timeout: float = 10.0) -> None:
     """Wait for page content to load."""
     try:
-        WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((
-                By.CSS_SELECTOR, 
-                "#ingredients li, .core-ingredient, [class*='ingredient'], script[type='application/ld+json']"
-            ))
+        WebDriverWait(driver, timeout, poll_frequency=_PAGE_POLL_INTERVAL).until(
+            EC.presence_of_element_located(_PAGE_READY_LOCATOR)
         )
     except Exception:
         pass
@@ -89,33 +138,33 @@ def login(driver: WebDriver, config: Config) -> bool:
     for url in login_urls:
         try:
             driver.get(url)
-            time.sleep(config.page_load_timeout)
-            dismiss_cookie_banner(driver)
+            
+            # Wait until either the session or the login form is rendered
+            try:
+                WebDriverWait(driver, config.page_load_timeout, poll_frequency=_POLL_INTERVAL).until(
+                    EC.any_of(
+                        EC.presence_of_element_located(_USER_PROFILE_LOCATOR),
+                        EC.presence_of_element_located(_PASSWORD_INPUT_LOCATOR),
+                    )
+                )
+            except TimeoutException:
+                pass
+            
+            dismiss_cookie_banner(driver, timeout=1.0)
             
             # Check if already logged in
             try:
-                driver.find_element(By.TAG_NAME, "core-user-profile")
+                driver.find_element(*_USER_PROFILE_LOCATOR)
                 log.info("Already logged in")
                 return True
             except Exception:
                 pass
             
             # Find email input
-            email_input = _find_element_by_selectors(driver, [
-                'input[type="email"]',
-                'input[name="email"]',
-                'input[name="username"]',
-                'input[id*="email" i]',
-                'input[id*="user" i]',
-            ])
+            email_input = _find_element_by_selectors(driver, _EMAIL_INPUT_SELECTORS)
             
             # Find password input
-            pass_input = _find_element_by_selectors(driver, [
-                'input[type="password"]',
-                'input[name="password"]',
-                'input[name*="pass" i]',
-                'input[id*="pass" i]',
-            ])
+            pass_input = _find_element_by_selectors(driver, _PASSWORD_INPUT_SELECTORS)
             
             if not email_input or not pass_input:
                 continue
@@ -130,10 +179,10 @@ def login(driver: WebDriver, config: Config) -> bool:
             if not _click_submit(driver):
                 pass_input.send_keys(Keys.ENTER)
             
-            time.sleep(config.page_load_timeout)
-            
-            # Verify login
-            driver.find_element(By.TAG_NAME, "core-user-profile")
+            # Verify login as soon as the profile element renders
+            WebDriverWait(driver, config.page_load_timeout, poll_frequency=_POLL_INTERVAL).until(
+                EC.presence_of_element_located(_USER_PROFILE_LOCATOR)
+            )
             log.info("Login successful")
             return True
             
@@ -148,13 +197,22 @@ def logout(driver: WebDriver, config: Config) -> None:
     """Logout from Cookidoo."""
     try:
         driver.get(f"{config.base_url}profile/logout")
-        time.sleep(config.page_load_timeout)
+        WebDriverWait(driver, config.page_load_timeout, poll_frequency=_POLL_INTERVAL).until_not(
+            EC.presence_of_element_located(_USER_PROFILE_LOCATOR)
+        )
     except Exception:
         pass
 
 
-def _find_element_by_selectors(driver: WebDriver, selectors: list[str]):
-    """Find element using multiple CSS selectors."""
+def _find_element_by_selectors(driver: WebDriver, selectors: tuple[str, ...]):
+    """Find first element matching any of the CSS selectors in one lookup."""
+    try:
+        elements = driver.find_elements(By.CSS_SELECTOR, ", ".join(selectors))
+        return elements[0] if elements else None
+    except Exception:
+        pass
+    
+    # Combined selector rejected by the browser; try them one at a time
     for selector in selectors:
         try:
             return driver.find_element(By.CSS_SELECTOR, selector)
@@ -166,7 +224,7 @@ def _find_element_by_selectors(driver: WebDriver, selectors: list[str]):
 def _click_submit(driver: WebDriver) -> bool:
     """Click submit button if found."""
     try:
-        driver.find_element(By.CSS_SELECTOR, 'button[type="submit"], input[type="submit"]').click()
+        driver.find_element(*_SUBMIT_LOCATOR).click()
         return True
     except Exception:
         return False
@@ -26,6 +26,7 @@ class Config:
     # Paths
     output_dir: Path = field(default_factory=lambda: Path("/data"))
     state_file: Path | None = None
+    algolia_cache_file: Path | None = None
     chromedriver_path: Path = field(default_factory=lambda: Path("/usr/bin/chromedriver"))
     
     # Cookidoo settings
@@ -37,6 +38,19 @@ class Config:
     mode: RunMode = RunMode.SKIP_EXISTING
     headless: bool = True
     recipe_ids: list[str] = field(default_factory=list)
+    download_workers: int = 1  # Browsers downloading in parallel, including the main one
+    
+    # Browser requests to drop at the network layer (CDP URL patterns)
+    blocked_url_patterns: list[str] = field(default_factory=lambda: [
+        "*google-analytics*",
+        "*googletagmanager*",
+        "*doubleclick*",
+        "*segment.io*",
+        "*hotjar*",
+        "*.woff2",
+        "*.woff",
+        "*/fonts/*",
+    ])
     
     # Timeouts
     page_load_timeout: float = 3.0
@@ -46,11 +60,13 @@ class Config:
     # Rate limiting
     download_delay: float = 0.2
     algolia_delay: float = 0.1
+    algolia_workers: int = 8
     retry_delay: float = 2.0
     max_retries: int = 2
     
     # State persistence
     save_interval: int = 10  # Save state every N downloads
+    algolia_cache_ttl: float = 24 * 3600  # Seconds a cached prefix query stays valid
     
     # Logging
     log_level: str = "INFO"
@@ -62,6 +78,10 @@ class Config:
     
     def __post_init__(self) -> None:
         """Ensure paths are Path objects and set derived values."""
+        self._normalize_paths()
+    
+    def _normalize_paths(self) -> None:
+        """Coerce path fields to Path, fill derived paths and create the output directory."""
         if isinstance(self.output_dir, str):
             self.output_dir = Path(self.output_dir)
         if isinstance(self.chromedriver_path, str):
@@ -69,12 +89,19 @@ class Config:
         
         # Default state file location
         if self.state_file is None:
-            self.state_file = self.output_dir / ".scraper_state.json"
+            self.state_file = self.output_dir / ".scraper_state.db"
         elif isinstance(self.state_file, str):
             self.state_file = Path(self.state_file)
         
+        # Default Algolia query cache location
+        if self.algolia_cache_file is None:
+            self.algolia_cache_file = self.output_dir / ".algolia_cache.json"
+        elif isinstance(self.algolia_cache_file, str):
+            self.algolia_cache_file = Path(self.algolia_cache_file)
+        
         # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        if not self.output_dir.is_dir():
+            self.output_dir.mkdir(parents=True, exist_ok=True)
     
     @property
     def base_url(self) -> str:
@@ -110,6 +137,13 @@ class Config:
         except ValueError:
             mode = RunMode.SKIP_EXISTING
         
+        # Parse download worker count, at least one browser
+        workers_str = get_env("THERMOMIX_WORKERS", default="1")
+        try:
+            download_workers = max(1, int(workers_str))
+        except ValueError:
+            download_workers = 1
+        
         # Parse recipe IDs (comma-separated)
         recipe_ids_str = get_env("THERMOMIX_RECIPE_IDS", "RECIPE_IDS", default="")
         recipe_ids = [r.strip() for r in recipe_ids_str.split(",") if r.strip()] if recipe_ids_str else []
@@ -123,6 +157,7 @@ class Config:
             mode=mode,
             headless=get_bool("THERMOMIX_HEADLESS", "HEADLESS", default=True),
             recipe_ids=recipe_ids,
+            download_workers=download_workers,
             debug=get_bool("THERMOMIX_DEBUG", "DEBUG", default=False),
             log_level=get_env("THERMOMIX_LOG_LEVEL", "LOG_LEVEL", default="INFO"),
         )
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 
-@dataclass
+def parse_timestamp(value: Any) -> float:
+    """Parse an epoch timestamp, accepting legacy ISO strings."""
+    if value is None:
+        return time.time()
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except (TypeError, ValueError):
+        return time.time()
+
+
+@dataclass(slots=True)
 class Recipe:
     """Recipe data model."""
     
@@ -61,7 +76,7 @@ class Recipe:
         return bool(self.ingredients or self.steps)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeState:
     """Scraper state for resume capability."""
     
@@ -69,40 +84,21 @@ class ScrapeState:
     pending: set[str] = field(default_factory=set)
     completed: set[str] = field(default_factory=set)
     failed: set[str] = field(default_factory=set)
-    last_updated: datetime = field(default_factory=datetime.now)
-    
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "discovered": sorted(self.discovered),
-            "pending": sorted(self.pending),
-            "completed": sorted(self.completed),
-            "failed": sorted(self.failed),
-            "last_updated": self.last_updated.isoformat(),
-        }
+    last_updated: float = field(default_factory=time.time)
     
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ScrapeState:
-        """Create from dictionary."""
-        last_updated = data.get("last_updated")
-        if isinstance(last_updated, str):
-            try:
-                last_updated = datetime.fromisoformat(last_updated)
-            except ValueError:
-                last_updated = datetime.now()
-        elif last_updated is None:
-            last_updated = datetime.now()
-        
+        """Create from a legacy JSON state file's contents."""
         return cls(
             discovered=set(data.get("discovered") or []),
             pending=set(data.get("pending") or []),
             completed=set(data.get("completed") or []),
             failed=set(data.get("failed") or []),
-            last_updated=last_updated,
+            last_updated=parse_timestamp(data.get("last_updated")),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapeStats:
     """Scraping statistics."""
     
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import html
-import json
 import logging
 import re
 from typing import TYPE_CHECKING, Any
 
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
+from . import jsonio
 from .models import Recipe
 
 if TYPE_CHECKING:
@@ -17,41 +17,130 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("thermomix.parser")
 
+_WS_RE = re.compile(r" +")
+_DIGITS_RE = re.compile(r"\d+")
+
+_TM_VERSIONS = ("TM5", "TM6", "TM7")
+
+_INGREDIENT_SELECTORS = (
+    "#ingredients li",
+    ".core-ingredient",
+    "[class*='ingredient-item']",
+    ".recipe-ingredients li",
+    "[data-ingredient]",
+    ".rdp-ingredients li",
+)
+
+_STEP_SELECTORS = (
+    "#preparation-steps li",
+    ".core-step",
+    "[class*='step-item']",
+    ".recipe-steps li",
+    ".rdp-steps li",
+    "[data-step]",
+)
+
+# JSON-LD keys that may hold nested objects / step lists, reversed for
+# pushing onto a LIFO stack so children pop in document order
+_JSONLD_NESTED_KEYS_LIFO = ("@graph", "mainEntity", "mainEntityOfPage", "itemListElement", "hasPart")[::-1]
+_STEP_NESTED_KEYS_LIFO = ("itemListElement", "steps", "step", "elements")[::-1]
+
+# Collects the JSON-LD and the few DOM strings the parser needs in one round trip
+_PAGE_DATA_JS = """
+const text = (el) => el ? el.textContent : null;
+const rating = document.querySelector("core-rating");
+return {
+    jsonld: Array.from(document.querySelectorAll('script[type="application/ld+json"]'), text),
+    ratingCounter: rating ? text(rating.querySelector(".core-rating__counter")) : null,
+    ratingLabel: rating ? text(rating.querySelector(".core-rating__label")) : null,
+    tmVersions: Array.from(document.querySelectorAll(".rdp-tm-versions__name, [class*='tm-version']"), text),
+    header: text(document.querySelector(".recipe-card__header, .rdp-header")),
+    lang: document.documentElement.getAttribute("lang"),
+};
+"""
+
 
 def parse_recipe(driver: WebDriver, recipe_id: str) -> Recipe:
-    """Parse recipe data from page source."""
-    page_html = driver.page_source
-    soup = BeautifulSoup(page_html, "html.parser")
+    """Parse recipe data from the live page, serializing the DOM only if JSON-LD is missing."""
+    source_url = driver.current_url
+    tree = None
+    
+    page = _read_page_data(driver, recipe_id)
+    if page is None:
+        tree = LexborHTMLParser(driver.page_source)
+        page = _page_data_from_tree(tree)
+    
+    # Page-level fields shared by both parse paths, extracted once
+    rating = _parse_rating(page.get("ratingCounter"), page.get("ratingLabel"))
+    tm_versions = _parse_tm_versions(page.get("tmVersions") or [], page.get("header"))
+    language = page.get("lang")
     
     # Try JSON-LD first (most reliable)
-    recipe = _parse_jsonld(soup, recipe_id, driver.current_url)
+    recipe = _parse_jsonld(page.get("jsonld") or [], recipe_id, source_url, rating, tm_versions, language)
     if recipe and recipe.is_complete():
         log.debug(f"Parsed {recipe_id} via JSON-LD: {len(recipe.ingredients)} ingredients")
         return recipe
     
     # Fallback to HTML parsing
-    recipe = _parse_html(soup, recipe_id, driver.current_url)
+    if tree is None:
+        tree = LexborHTMLParser(driver.page_source)
+    recipe = _parse_html(tree, recipe_id, source_url, rating, tm_versions, language)
     log.debug(f"Parsed {recipe_id} via HTML: {len(recipe.ingredients)} ingredients")
     return recipe
 
 
-def _parse_jsonld(soup: BeautifulSoup, recipe_id: str, source_url: str | None) -> Recipe | None:
-    """Parse recipe from JSON-LD structured data."""
+def _read_page_data(driver: WebDriver, recipe_id: str) -> dict[str, Any] | None:
+    """Run the page data snippet in the browser, or None if it can't run."""
+    try:
+        page = driver.execute_script(_PAGE_DATA_JS)
+    except Exception as e:
+        log.debug(f"Page data script failed for {recipe_id}: {e}")
+        return None
+    return page if isinstance(page, dict) else None
+
+
+def _page_data_from_tree(tree: LexborHTMLParser) -> dict[str, Any]:
+    """Collect the same fields as the page data snippet from parsed HTML."""
+    rating = tree.css_first("core-rating")
+    counter = rating.css_first(".core-rating__counter") if rating else None
+    label = rating.css_first(".core-rating__label") if rating else None
+    header = tree.css_first(".recipe-card__header, .rdp-header")
+    html_el = tree.root  # The <html> element, without a selector query
+    
+    return {
+        "jsonld": [script.text() for script in tree.css('script[type="application/ld+json"]')],
+        "ratingCounter": counter.text() if counter else None,
+        "ratingLabel": label.text() if label else None,
+        "tmVersions": [el.text() for el in tree.css(".rdp-tm-versions__name, [class*='tm-version']")],
+        "header": header.text() if header else None,
+        "lang": html_el.attributes.get("lang") if html_el else None,
+    }
+
+
+def _parse_jsonld(
+    scripts: list[str],
+    recipe_id: str,
+    source_url: str | None,
+    rating: tuple[float | None, int | None],
+    tm_versions: list[str],
+    language: str | None,
+) -> Recipe | None:
+    """Parse recipe from JSON-LD script contents."""
     try:
-        for script in soup.select('script[type="application/ld+json"]'):
-            if not script.string:
+        for content in scripts:
+            if not content:
                 continue
             
             try:
-                data = json.loads(script.string)
-            except json.JSONDecodeError:
+                data = jsonio.loads(content)
+            except ValueError:
                 continue
             
             for obj in _iter_jsonld_objects(data):
                 if not _is_recipe_type(obj):
                     continue
                 
-                return _extract_recipe_from_jsonld(obj, soup, recipe_id, source_url)
+                return _extract_recipe_from_jsonld(obj, recipe_id, source_url, rating, tm_versions, language)
     
     except Exception as e:
         log.debug(f"JSON-LD parsing failed for {recipe_id}: {e}")
@@ -59,71 +148,60 @@ def _parse_jsonld(soup: BeautifulSoup, recipe_id: str, source_url: str | None) -
     return None
 
 
-def _parse_html(soup: BeautifulSoup, recipe_id: str, source_url: str | None) -> Recipe:
+def _parse_html(
+    tree: LexborHTMLParser,
+    recipe_id: str,
+    source_url: str | None,
+    rating: tuple[float | None, int | None],
+    tm_versions: list[str],
+    language: str | None,
+) -> Recipe:
     """Parse recipe from HTML elements (fallback)."""
-    rating_score, rating_count = _extract_rating(soup)
-    tm_versions = _extract_tm_versions(soup)
+    rating_score, rating_count = rating
     
-    ingredients = _extract_by_selectors(soup, [
-        "#ingredients li",
-        ".core-ingredient",
-        "[class*='ingredient-item']",
-        ".recipe-ingredients li",
-        "[data-ingredient]",
-        ".rdp-ingredients li",
-    ])
-    
-    steps = _extract_by_selectors(soup, [
-        "#preparation-steps li",
-        ".core-step",
-        "[class*='step-item']",
-        ".recipe-steps li",
-        ".rdp-steps li",
-        "[data-step]",
-    ])
+    ingredients = _extract_by_selectors(tree, _INGREDIENT_SELECTORS)
+    steps = _extract_by_selectors(tree, _STEP_SELECTORS)
     
     tags = [
-        a.text.replace("#", "").replace("\n", "").strip().lower()
-        for a in soup.select(".core-tags-wrapper__tags-container a")
-        if a.text.strip()
+        a.text().replace("#", "").replace("\n", "").strip().lower()
+        for a in tree.css(".core-tags-wrapper__tags-container a")
+        if a.text().strip()
     ]
     
-    title = _get_text(soup, ".recipe-card__title") or _get_text(soup, "h1") or _get_text(soup, "title") or ""
-    
-    html_el = soup.select_one("html")
-    language = html_el.get("lang") if html_el else None
+    title = _get_text(tree, ".recipe-card__title") or _get_text(tree, "h1") or _get_text(tree, "title") or ""
     
     return Recipe(
         id=recipe_id,
         source_url=source_url,
         language=language,
-        title=html.unescape(title),
+        title=_unescape(title),
         rating_score=rating_score,
         rating_count=rating_count,
         tm_versions=tm_versions,
-        ingredients=[html.unescape(i) for i in ingredients],
-        steps=[html.unescape(s) for s in steps],
+        ingredients=[_unescape(i) for i in ingredients],
+        steps=[_unescape(s) for s in steps],
         tags=tags,
     )
 
 
 def _extract_recipe_from_jsonld(
     obj: dict[str, Any],
-    soup: BeautifulSoup,
     recipe_id: str,
     source_url: str | None,
+    rating: tuple[float | None, int | None],
+    tm_versions: list[str],
+    language: str | None,
 ) -> Recipe:
     """Extract recipe data from JSON-LD object."""
-    rating_score, rating_count = _extract_rating(soup)
-    tm_versions = _extract_tm_versions(soup)
+    rating_score, rating_count = rating
     
     # Decode HTML entities in ingredients
     raw_ingredients = obj.get("recipeIngredient") or []
-    ingredients = [html.unescape(str(i)) for i in raw_ingredients]
+    ingredients = [_unescape(str(i)) for i in raw_ingredients]
     
     # Extract steps with HTML entity decoding
     raw_steps = _flatten_steps(obj.get("recipeInstructions"))
-    steps = [html.unescape(s) for s in raw_steps]
+    steps = [_unescape(s) for s in raw_steps]
     
     # Extract nutrition
     nutritions = {}
@@ -143,14 +221,13 @@ def _extract_recipe_from_jsonld(
             rating_score = ar.get("ratingValue")
             rating_count = ar.get("ratingCount")
     
-    html_el = soup.select_one("html")
-    language = obj.get("inLanguage") or (html_el.get("lang") if html_el else None)
+    language = obj.get("inLanguage") or language
     
     return Recipe(
         id=recipe_id,
         source_url=source_url,
         language=language,
-        title=html.unescape(obj.get("name") or ""),
+        title=_unescape(obj.get("name") or ""),
         rating_score=rating_score,
         rating_count=rating_count,
         tm_versions=tm_versions,
@@ -163,18 +240,20 @@ def _extract_recipe_from_jsonld(
 
 def _iter_jsonld_objects(node: Any):
     """Iterate through JSON-LD objects, handling nesting patterns."""
-    if node is None:
-        return
-    
-    if isinstance(node, dict):
-        yield node
-        for key in ("@graph", "mainEntity", "mainEntityOfPage", "itemListElement", "hasPart"):
-            if key in node:
-                yield from _iter_jsonld_objects(node[key])
+    stack = [node]
     
-    elif isinstance(node, list):
-        for item in node:
-            yield from _iter_jsonld_objects(item)
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        
+        if node_type is dict:
+            yield node
+            for key in _JSONLD_NESTED_KEYS_LIFO:
+                if key in node:
+                    stack.append(node[key])
+        
+        elif node_type is list:
+            stack.extend(reversed(node))
 
 
 def _is_recipe_type(obj: dict[str, Any]) -> bool:
@@ -187,132 +266,126 @@ def _is_recipe_type(obj: dict[str, Any]) -> bool:
 
 def _flatten_steps(node: Any) -> list[str]:
     """Extract step texts from recipeInstructions (supports nesting)."""
-    steps = []
-    
-    if node is None:
-        return steps
+    steps: list[str] = []
+    stack = [node]
     
-    if isinstance(node, str):
-        txt = node.strip()
-        return [txt] if txt else []
-    
-    if isinstance(node, dict):
-        txt = node.get("text")
-        if isinstance(txt, str) and txt.strip():
-            steps.append(txt.strip())
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
         
-        for key in ("itemListElement", "steps", "step", "elements"):
-            if key in node:
-                for child in _ensure_list(node.get(key)):
-                    steps.extend(_flatten_steps(child))
-        return steps
-    
-    if isinstance(node, list):
-        for item in node:
-            steps.extend(_flatten_steps(item))
+        if node_type is str:
+            txt = node.strip()
+            if txt:
+                steps.append(txt)
+        
+        elif node_type is dict:
+            txt = node.get("text")
+            if type(txt) is str:
+                txt = txt.strip()
+                if txt:
+                    steps.append(txt)
+            
+            for key in _STEP_NESTED_KEYS_LIFO:
+                child = node.get(key)
+                if child is not None:
+                    stack.append(child)
+        
+        elif node_type is list:
+            stack.extend(reversed(node))
     
     return steps
 
 
 def _extract_tags(obj: dict[str, Any]) -> list[str]:
     """Extract and normalize tags from JSON-LD."""
-    tags = []
-    
     # Keywords
     keywords = obj.get("keywords")
     if isinstance(keywords, str):
-        tags.extend(t.strip() for t in keywords.split(",") if t.strip())
+        parts = keywords.split(",")
     elif isinstance(keywords, list):
-        tags.extend(str(t).strip() for t in keywords if str(t).strip())
+        parts = [str(t) for t in keywords]
+    else:
+        parts = []
     
     # Categories and cuisine
     for key in ("recipeCategory", "recipeCuisine"):
-        for t in _ensure_list(obj.get(key)):
-            if isinstance(t, str) and t.strip():
-                tags.extend(p.strip() for p in t.split(",") if p.strip())
+        value = obj.get(key)
+        for t in value if isinstance(value, list) else (value,):
+            if isinstance(t, str):
+                parts.extend(t.split(","))
     
-    # Normalize and dedupe
-    seen = set()
-    normalized = []
-    for t in tags:
-        lower = t.lower()
-        if lower and lower not in seen:
-            seen.add(lower)
-            normalized.append(lower)
+    # Normalize and dedupe in one pass
+    seen: set[str] = set()
+    tags: list[str] = []
+    for part in parts:
+        tag = part.strip().lower()
+        if tag and tag not in seen:
+            seen.add(tag)
+            tags.append(tag)
     
-    return normalized
+    return tags
 
 
-def _extract_rating(soup: BeautifulSoup) -> tuple[float | None, int | None]:
-    """Extract rating score and count from HTML."""
+def _parse_rating(counter: str | None, label: str | None) -> tuple[float | None, int | None]:
+    """Parse rating score and count from the rating widget texts."""
     score = None
     count = None
     
-    rating_container = soup.select_one("core-rating")
-    if rating_container:
-        counter = rating_container.select_one(".core-rating__counter")
-        if counter:
+    if counter:
+        try:
+            score = float(counter.strip())
+        except (ValueError, TypeError):
+            pass
+    
+    if label:
+        txt = label.strip()
+        m = _DIGITS_RE.search(txt.replace(".", "").replace(",", ""))
+        if m:
             try:
-                score = float(counter.text.strip())
+                count = int(m.group())
             except (ValueError, TypeError):
                 pass
-        
-        label = rating_container.select_one(".core-rating__label")
-        if label:
-            txt = label.text.strip()
-            m = re.search(r"\d+", txt.replace(".", "").replace(",", ""))
-            if m:
-                try:
-                    count = int(m.group())
-                except (ValueError, TypeError):
-                    pass
     
     return score, count
 
 
-def _extract_tm_versions(soup: BeautifulSoup) -> list[str]:
-    """Extract TM versions (TM5, TM6, TM7) from page."""
+def _parse_tm_versions(texts: list[str], header: str | None) -> list[str]:
+    """Collect TM versions from version badge texts, falling back to the header text."""
     versions = []
     
-    for el in soup.select(".rdp-tm-versions__name, [class*='tm-version']"):
-        txt = el.text.strip()
-        for tm in ("TM5", "TM6", "TM7"):
+    for txt in texts:
+        if not txt:
+            continue
+        for tm in _TM_VERSIONS:
             if tm in txt and tm not in versions:
                 versions.append(tm)
     
-    if not versions:
-        header = soup.select_one(".recipe-card__header, .rdp-header")
-        if header:
-            txt = header.text
-            for tm in ("TM5", "TM6", "TM7"):
-                if tm in txt and tm not in versions:
-                    versions.append(tm)
+    if not versions and header:
+        for tm in _TM_VERSIONS:
+            if tm in header and tm not in versions:
+                versions.append(tm)
     
     return sorted(versions)
 
 
-def _extract_by_selectors(soup: BeautifulSoup, selectors: list[str]) -> list[str]:
+def _extract_by_selectors(tree: LexborHTMLParser, selectors: tuple[str, ...]) -> list[str]:
     """Extract text from first matching selector."""
     for selector in selectors:
-        items = soup.select(selector)
+        items = tree.css(selector)
         if items:
-            result = [re.sub(r" +", " ", li.text).replace("\n", " ").strip() for li in items]
+            result = [_WS_RE.sub(" ", li.text()).replace("\n", " ").strip() for li in items]
             result = [i for i in result if i]
             if result:
                 return result
     return []
 
 
-def _get_text(soup: BeautifulSoup, selector: str) -> str | None:
+def _get_text(tree: LexborHTMLParser, selector: str) -> str | None:
     """Get text from selector or None."""
-    el = soup.select_one(selector)
-    return el.text.strip() if el else None
+    el = tree.css_first(selector)
+    return el.text().strip() if el else None
 
 
-def _ensure_list(value: Any) -> list:
-    """Ensure value is a list."""
-    if value is None:
-        return []
-    if isinstance(value, list):
-        return value
-    return [value]
+def _unescape(text: str) -> str:
+    """Decode HTML entities, skipping the common entity-free case."""
+    return html.unescape(text) if "&" in text else text
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
+import sys
 import threading
 import time
 from queue import Empty, Queue
@@ -12,8 +14,8 @@ from selenium.webdriver.common.by import By
 
 from .algolia import AlgoliaClient
 from .browser import browser_session, dismiss_cookie_banner, login, logout, wait_for_page_load
-from .config import RunMode
-from .models import ScrapeStats
+from .config import RunMode, setup_logging
+from .models import Recipe, ScrapeStats
 from .parser import parse_recipe
 from .state import StateManager
 
@@ -24,6 +26,79 @@ if TYPE_CHECKING:
 
 log = logging.getLogger("thermomix.scraper")
 
+DISCOVERY_BATCH_SIZE = 32  # Discovered IDs handled per state/lock round-trip
+
+
+def fetch_recipe(driver: WebDriver, config: Config, recipe_id: str) -> Recipe | None:
+    """Load and parse a single recipe page. Returns None if every attempt failed."""
+    url = f"{config.base_url}recipes/recipe/{config.url_locale}/{recipe_id}"
+    
+    for attempt in range(config.max_retries + 1):
+        try:
+            driver.get(url)
+            wait_for_page_load(driver)  # Returns as soon as JSON-LD or ingredients are in the DOM
+            
+            dismiss_cookie_banner(driver)
+            _remove_base_tag(driver)
+            
+            recipe = parse_recipe(driver, recipe_id)
+            
+            # Validate content
+            if not recipe.is_complete():
+                if attempt < config.max_retries:
+                    log.debug(f"Empty content for {recipe_id}, retry {attempt + 1}")
+                    time.sleep(config.retry_delay)
+                    continue
+                log.warning(f"Empty content for {recipe_id}")
+            
+            time.sleep(config.download_delay)
+            return recipe
+        
+        except Exception as e:
+            if attempt < config.max_retries:
+                time.sleep(config.retry_delay)
+                continue
+            log.error(f"Failed {recipe_id}: {e}")
+            return None
+    
+    return None
+
+
+def _remove_base_tag(driver: WebDriver) -> None:
+    """Remove base tag that interferes with parsing."""
+    try:
+        driver.execute_script(
+            "var el = arguments[0]; el.parentNode.removeChild(el);",
+            driver.find_element(By.TAG_NAME, "base"),
+        )
+    except Exception:
+        pass
+
+
+def _download_process(config: Config, jobs: multiprocessing.Queue, results: multiprocessing.Queue) -> None:
+    """Worker process: fetch recipe IDs from jobs with its own browser until a None sentinel."""
+    setup_logging(config)
+    logged_in = False
+    
+    try:
+        with browser_session(config) as driver:
+            if not login(driver, config):
+                log.error("Download worker login failed")
+                return
+            logged_in = True
+            
+            while (recipe_id := jobs.get()) is not None:
+                results.put((recipe_id, fetch_recipe(driver, config, recipe_id)))
+            
+            logout(driver, config)
+    
+    except Exception as e:
+        log.error(f"Download worker failed: {e}")
+    
+    finally:
+        # Tell the parent this worker is gone, and whether it ever got to work
+        results.put((None, logged_in))
+
 
 class RecipeScraper:
     """Thermomix recipe scraper."""
@@ -37,6 +112,7 @@ class RecipeScraper:
         self._download_queue: Queue[str] = Queue()
         self._discovery_done = threading.Event()
         self._lock = threading.Lock()
+        self._downloads_since_save = 0
     
     def run(self) -> ScrapeStats:
         """Execute the scrape operation."""
@@ -101,8 +177,11 @@ class RecipeScraper:
             discovery_thread = threading.Thread(target=self._discovery_worker, daemon=True)
             discovery_thread.start()
         
-        # Download in main thread (Selenium isn't thread-safe)
-        self._download_worker(driver)
+        if self.config.download_workers > 1:
+            self._download_pool(driver)
+        else:
+            # Download in main thread (Selenium isn't thread-safe)
+            self._download_worker(driver)
         
         # Final state save
         self.state.save_state()
@@ -116,25 +195,16 @@ class RecipeScraper:
     def _discovery_worker(self) -> None:
         """Discover recipe IDs via Algolia."""
         try:
+            # Hand IDs over in small batches so locks are taken once per batch
+            batch: list[str] = []
             for recipe_id in self.algolia.discover_all():
-                self.state.mark_discovered(recipe_id)
-                
-                with self._lock:
-                    self.stats.discovered = len(self.state.state.discovered)
-                
-                if not self.state.should_download(recipe_id):
-                    with self._lock:
-                        self.stats.skipped += 1
-                    continue
-                
-                self.state.mark_pending(recipe_id)
-                self._download_queue.put(recipe_id)
-                
-                # Progress logging
-                if self.stats.discovered % 100 == 0:
-                    log.info(f"Discovery progress: {self.stats.discovered} found, {self._download_queue.qsize()} queued")
-                
-                time.sleep(self.config.algolia_delay)
+                batch.append(recipe_id)
+                if len(batch) >= DISCOVERY_BATCH_SIZE:
+                    self._queue_discovered(batch)
+                    batch = []
+            
+            if batch:
+                self._queue_discovered(batch)
         
         except Exception as e:
             log.error(f"Discovery failed: {e}")
@@ -143,10 +213,26 @@ class RecipeScraper:
             self._discovery_done.set()
             log.info(f"Discovery complete: {len(self.state.state.discovered)} recipes")
     
+    def _queue_discovered(self, recipe_ids: list[str]) -> None:
+        """Record a batch of discovered IDs and queue those that need downloading."""
+        recipe_ids = self.state.mark_discovered_many(recipe_ids)
+        to_download = [rid for rid in recipe_ids if self.state.should_download(rid)]
+        
+        with self._lock:
+            previous = self.stats.discovered
+            self.stats.discovered = len(self.state.state.discovered)
+            self.stats.skipped += len(recipe_ids) - len(to_download)
+        
+        self.state.mark_pending_many(to_download)
+        for recipe_id in to_download:
+            self._download_queue.put(recipe_id)
+        
+        # Progress logging
+        if self.stats.discovered // 100 > previous // 100:
+            log.info(f"Discovery progress: {self.stats.discovered} found, {self._download_queue.qsize()} queued")
+    
     def _download_worker(self, driver: WebDriver) -> None:
         """Process download queue."""
-        downloads_since_save = 0
-        
         while True:
             try:
                 recipe_id = self._download_queue.get(timeout=2.0)
@@ -155,72 +241,129 @@ class RecipeScraper:
                     break
                 continue
             
-            success = self._download_recipe(driver, recipe_id)
+            self._record_download(recipe_id, self._download_recipe(driver, recipe_id))
+            self._download_queue.task_done()
+    
+    def _download_pool(self, driver: WebDriver) -> None:
+        """Process download queue with this browser plus one extra browser per worker process."""
+        workers = self.config.download_workers
+        ctx = multiprocessing.get_context("spawn")
+        jobs = ctx.Queue()
+        results = ctx.Queue()
+        outstanding: set[str] = set()  # IDs handed out but not yet reported back
+        
+        log.info(f"Starting {workers - 1} extra download workers")
+        procs = [
+            ctx.Process(target=_download_process, args=(self.config, jobs, results), daemon=True)
+            for _ in range(workers - 1)
+        ]
+        for proc in procs:
+            proc.start()
+        
+        # Discovery stays a thread in this process; forward its IDs to the workers
+        threading.Thread(target=self._feed_jobs, args=(jobs, workers, outstanding), daemon=True).start()
+        
+        # This process is the only writer of recipe files and state. Its own browser
+        # takes jobs too, so the queue still drains if every worker fails to log in.
+        live = len(procs)
+        try:
+            while True:
+                live -= self._collect_results(results, outstanding)
+                try:
+                    recipe_id = jobs.get(timeout=0.5)
+                except Empty:
+                    continue
+                
+                if recipe_id is None:
+                    break
+                
+                success = self._download_recipe(driver, recipe_id)
+                outstanding.discard(recipe_id)
+                self._record_download(recipe_id, success)
             
-            with self._lock:
-                if success:
-                    self.stats.downloaded += 1
-                    self.state.mark_completed(recipe_id)
-                else:
-                    self.stats.failures += 1
-                    self.state.mark_failed(recipe_id)
+            # All jobs are handed out; wait for the workers to report their last recipes
+            while live and any(proc.is_alive() for proc in procs):
+                live -= self._collect_results(results, outstanding, timeout=2.0)
+            self._collect_results(results, outstanding)
             
-            downloads_since_save += 1
+            # Anything still outstanding went down with a crashed worker
+            for recipe_id in list(outstanding):
+                log.error(f"Failed {recipe_id}: download worker exited mid-download")
+                outstanding.discard(recipe_id)
+                self._record_download(recipe_id, False)
+        
+        finally:
+            for proc in procs:
+                proc.join(timeout=5.0)
+                if proc.is_alive():
+                    proc.terminate()
+    
+    def _collect_results(self, results: multiprocessing.Queue, outstanding: set[str], timeout: float = 0.0) -> int:
+        """Record recipes sent back by the workers. Returns how many workers exited."""
+        exited = 0
+        while True:
+            try:
+                recipe_id, payload = results.get(timeout=timeout) if timeout else results.get_nowait()
+            except Empty:
+                return exited
+            timeout = 0.0
             
-            # Periodic state save and logging
-            if downloads_since_save >= self.config.save_interval:
-                self.state.save_state()
-                log.info(f"Progress: {self.stats}")
-                downloads_since_save = 0
+            if recipe_id is None:
+                exited += 1
+                if not payload:
+                    log.warning("A download worker exited before logging in; continuing without it")
+                continue
             
-            self._download_queue.task_done()
+            outstanding.discard(recipe_id)
+            self._record_download(recipe_id, payload is not None and self._save_recipe(payload))
     
-    def _download_recipe(self, driver: WebDriver, recipe_id: str) -> bool:
-        """Download and save a single recipe."""
-        url = f"{self.config.base_url}recipes/recipe/{self.config.url_locale}/{recipe_id}"
-        
-        for attempt in range(self.config.max_retries + 1):
+    def _feed_jobs(self, jobs: multiprocessing.Queue, workers: int, outstanding: set[str]) -> None:
+        """Move queued IDs to the workers, then send one sentinel per worker."""
+        while True:
             try:
-                driver.get(url)
-                time.sleep(self.config.page_load_timeout)
-                wait_for_page_load(driver)
-                time.sleep(1.0)  # Extra JS load time
-                
-                dismiss_cookie_banner(driver)
-                self._remove_base_tag(driver)
-                
-                recipe = parse_recipe(driver, recipe_id)
-                
-                # Validate content
-                if not recipe.is_complete():
-                    if attempt < self.config.max_retries:
-                        log.debug(f"Empty content for {recipe_id}, retry {attempt + 1}")
-                        time.sleep(self.config.retry_delay)
-                        continue
-                    log.warning(f"Empty content for {recipe_id}")
-                
-                self.state.save_recipe(recipe)
-                time.sleep(self.config.download_delay)
-                return True
+                recipe_id = self._download_queue.get(timeout=2.0)
+            except Empty:
+                if self._discovery_done.is_set() and self._download_queue.empty():
+                    break
+                continue
             
-            except Exception as e:
-                if attempt < self.config.max_retries:
-                    time.sleep(self.config.retry_delay)
-                    continue
-                log.error(f"Failed {recipe_id}: {e}")
-                return False
+            outstanding.add(recipe_id)
+            jobs.put(recipe_id)
+        
+        for _ in range(workers):
+            jobs.put(None)
+    
+    def _record_download(self, recipe_id: str, success: bool) -> None:
+        """Record a download outcome, saving state periodically."""
+        with self._lock:
+            if success:
+                self.stats.downloaded += 1
+                self.state.mark_completed(recipe_id)
+            else:
+                self.stats.failures += 1
+                self.state.mark_failed(recipe_id)
         
-        return False
+        self._downloads_since_save += 1
+        
+        # Periodic state save and logging
+        if self._downloads_since_save >= self.config.save_interval:
+            self.state.save_state()
+            log.info(f"Progress: {self.stats}")
+            self._downloads_since_save = 0
     
-    def _remove_base_tag(self, driver: WebDriver) -> None:
-        """Remove base tag that interferes with parsing."""
+    def _download_recipe(self, driver: WebDriver, recipe_id: str) -> bool:
+        """Download and save a single recipe."""
+        recipe = fetch_recipe(driver, self.config, recipe_id)
+        return recipe is not None and self._save_recipe(recipe)
+    
+    def _save_recipe(self, recipe: Recipe) -> bool:
+        """Write a recipe file, logging instead of raising on failure."""
         try:
-            driver.execute_script(
-                "var el = arguments[0]; el.parentNode.removeChild(el);",
-                driver.find_element(By.TAG_NAME, "base"),
-            )
-        except Exception:
-            pass
+            self.state.save_recipe(recipe)
+            return True
+        except Exception as e:
+            log.error(f"Failed to save {recipe.id}: {e}")
+            return False
     
     @staticmethod
     def _normalize_id(recipe_id: str) -> str | None:
@@ -232,10 +375,13 @@ class RecipeScraper:
             rid = "r" + rid
         if not rid.startswith("r"):
             rid = "r" + rid.lstrip("r")
-        return rid
+        return sys.intern(rid)
 
 
 def scrape(config: Config) -> ScrapeStats:
     """Main entry point for scraping."""
     scraper = RecipeScraper(config)
-    return scraper.run()
+    try:
+        return scraper.run()
+    finally:
+        scraper.algolia.close()
@@ -2,18 +2,50 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterable
 
-from .models import Recipe, ScrapeState
+from . import jsonio
+from .models import Recipe, ScrapeState, parse_timestamp
 
 if TYPE_CHECKING:
     from .config import Config
 
 log = logging.getLogger("thermomix.state")
 
+# Recipe status codes in the state database
+STATUS_DISCOVERED = 0
+STATUS_PENDING = 1
+STATUS_COMPLETED = 2
+STATUS_FAILED = 3
+
+LEGACY_STATE_FILE = ".scraper_state.json"
+
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _dict_is_complete(data: dict) -> bool:
+    """Recipe.is_complete() on a raw recipe dict, without building a Recipe."""
+    return bool(data.get("ingredients") or data.get("steps"))
+
+
+def _scan_one(fpath: str) -> tuple[str, bool]:
+    """Read a recipe file and report whether it is complete."""
+    recipe_id = sys.intern(os.path.basename(fpath)[:-5])
+    try:
+        with open(fpath, "rb") as f:
+            data = jsonio.loads(f.read())
+        return recipe_id, _dict_is_complete(data)
+    except Exception:
+        return recipe_id, True
+
 
 class StateManager:
     """Manages scraper state and recipe storage."""
@@ -21,18 +53,57 @@ class StateManager:
     def __init__(self, config: Config):
         self.config = config
         self.state = ScrapeState()
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        
+        # IDs whose status changed since the last save
+        self._dirty: set[str] = set()
+        self._dirty_lock = threading.Lock()
+        
+        # Recipe files present in output_dir, filled by the startup scan
+        self._disk_ids: set[str] = set()
+        
         self._load_state()
         self._scan_existing_recipes()
     
+    def _connect(self) -> sqlite3.Connection:
+        """Open the state database, creating the schema if needed."""
+        if self._db is None:
+            self.config.state_file.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(self.config.state_file, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")  # WAL commits without an fsync each
+            db.execute("CREATE TABLE IF NOT EXISTS state (id TEXT PRIMARY KEY, status INTEGER NOT NULL)")
+            db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._db = db
+        return self._db
+    
     def _load_state(self) -> None:
-        """Load state from file if exists."""
-        if not self.config.state_file or not self.config.state_file.exists():
+        """Load state from database if exists."""
+        if not self.config.state_file:
+            return
+        
+        if not self.config.state_file.exists():
+            self._migrate_legacy_state()
             return
         
         try:
-            with open(self.config.state_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.state = ScrapeState.from_dict(data)
+            db = self._connect()
+            sets = {
+                STATUS_PENDING: self.state.pending,
+                STATUS_COMPLETED: self.state.completed,
+                STATUS_FAILED: self.state.failed,
+            }
+            for recipe_id, status in db.execute("SELECT id, status FROM state"):
+                recipe_id = sys.intern(recipe_id)
+                self.state.discovered.add(recipe_id)
+                if status in sets:
+                    sets[status].add(recipe_id)
+            
+            meta = dict(db.execute("SELECT key, value FROM meta"))
+            if "last_updated" in meta:
+                self.state.last_updated = parse_timestamp(meta["last_updated"])
+            
             log.info(
                 f"Loaded state: {len(self.state.pending)} pending, "
                 f"{len(self.state.completed)} completed, {len(self.state.failed)} failed"
@@ -40,6 +111,27 @@ class StateManager:
         except Exception as e:
             log.warning(f"Failed to load state: {e}")
     
+    def _migrate_legacy_state(self) -> None:
+        """Import a JSON state file left by older versions."""
+        legacy_file = self.config.output_dir / LEGACY_STATE_FILE
+        if not legacy_file.exists():
+            return
+        
+        try:
+            with open(legacy_file, "rb") as f:
+                state = ScrapeState.from_dict(jsonio.loads(f.read()))
+            for ids in (state.discovered, state.pending, state.completed, state.failed):
+                interned = {sys.intern(rid) for rid in ids}
+                ids.clear()
+                ids.update(interned)
+            self.state = state
+            self._dirty.update(self.state.discovered, self.state.pending, self.state.completed, self.state.failed)
+            self.save_state()
+            legacy_file.unlink()
+            log.info(f"Migrated legacy state: {len(self.state.pending)} pending, {len(self.state.completed)} completed")
+        except Exception as e:
+            log.warning(f"Failed to migrate legacy state: {e}")
+    
     def _scan_existing_recipes(self) -> None:
         """Scan output directory for existing recipe files."""
         if not self.config.output_dir.is_dir():
@@ -48,51 +140,107 @@ class StateManager:
         complete_count = 0
         incomplete_count = 0
         
-        for fpath in self.config.output_dir.glob("*.json"):
-            if fpath.name.startswith("."):
-                continue
-            
-            recipe_id = fpath.stem
-            try:
-                with open(fpath, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                
-                recipe = Recipe.from_dict(data)
-                self.state.discovered.add(recipe_id)
+        # Files the state store already marks complete need no re-check
+        known_complete = self.state.completed
+        files: list[str] = []
+        
+        with os.scandir(self.config.output_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith(".") or not name.endswith(".json") or not entry.is_file():
+                    continue
                 
-                if recipe.is_complete():
-                    self.state.completed.add(recipe_id)
-                    self.state.pending.discard(recipe_id)
-                    complete_count += 1
-                else:
-                    self.state.pending.add(recipe_id)
-                    incomplete_count += 1
+                recipe_id = sys.intern(name[:-5])
+                self._disk_ids.add(recipe_id)
+                if recipe_id not in known_complete:
+                    files.append(entry.path)
+        
+        # File reads dominate, so a thread pool overlaps the I/O
+        results: list[tuple[str, bool]] = []
+        if files:
+            with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as executor:
+                results = list(executor.map(_scan_one, files))
+        
+        for recipe_id, complete in results:
+            self._dirty.add(recipe_id)
+            self.state.discovered.add(recipe_id)
             
-            except Exception:
-                self.state.discovered.add(recipe_id)
+            if complete:
                 self.state.completed.add(recipe_id)
+                self.state.pending.discard(recipe_id)
                 complete_count += 1
+            else:
+                self.state.pending.add(recipe_id)
+                incomplete_count += 1
         
         if complete_count or incomplete_count:
             log.info(f"Found {complete_count} complete, {incomplete_count} incomplete recipes")
     
     def save_state(self) -> None:
-        """Persist current state to file."""
+        """Persist status changes since the last save to database."""
         if not self.config.state_file:
             return
         
+        self.state.last_updated = time.time()
+        
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+        
+        rows = [(recipe_id, self._status(recipe_id)) for recipe_id in dirty]
+        
         try:
-            self.config.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.config.state_file, "w", encoding="utf-8") as f:
-                json.dump(self.state.to_dict(), f, ensure_ascii=False, indent=2)
+            with self._db_lock:
+                db = self._connect()
+                with db:
+                    db.executemany("INSERT OR REPLACE INTO state (id, status) VALUES (?, ?)", rows)
+                    db.execute(
+                        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                        ("last_updated", self.state.last_updated),
+                    )
         except Exception as e:
             log.warning(f"Failed to save state: {e}")
+            with self._dirty_lock:
+                self._dirty |= dirty
+    
+    def _record_outcome(self, recipe_id: str) -> None:
+        """Commit a download outcome immediately so an interrupted run keeps it."""
+        if not self.config.state_file:
+            return
+        
+        try:
+            with self._db_lock:
+                db = self._connect()
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO state (id, status) VALUES (?, ?)",
+                        (recipe_id, self._status(recipe_id)),
+                    )
+        except Exception as e:
+            log.debug(f"Deferring state write for {recipe_id}: {e}")
+            self._mark_dirty(recipe_id)
+    
+    def _status(self, recipe_id: str) -> int:
+        """Status code to persist; pending and failed take precedence as they drive resume."""
+        if recipe_id in self.state.pending:
+            return STATUS_PENDING
+        if recipe_id in self.state.failed:
+            return STATUS_FAILED
+        if recipe_id in self.state.completed:
+            return STATUS_COMPLETED
+        return STATUS_DISCOVERED
     
     def clear_state(self) -> None:
-        """Remove state file on completion."""
-        if self.config.state_file and self.config.state_file.exists():
+        """Remove state database on completion."""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+        
+        state_file = self.config.state_file
+        if state_file and state_file.exists():
             try:
-                self.config.state_file.unlink()
+                for path in (state_file, Path(f"{state_file}-wal"), Path(f"{state_file}-shm")):
+                    path.unlink(missing_ok=True)
                 log.info("State file removed (scan complete)")
             except Exception:
                 pass
@@ -102,16 +250,19 @@ class StateManager:
         return self.config.output_dir / f"{recipe_id}.json"
     
     def recipe_exists(self, recipe_id: str) -> bool:
-        """Check if recipe file exists."""
-        return self.recipe_path(recipe_id).exists()
+        """Check if recipe file exists, without a filesystem call."""
+        return recipe_id in self._disk_ids
     
     def save_recipe(self, recipe: Recipe) -> None:
-        """Save recipe to JSON file."""
+        """Save recipe to JSON file atomically, so a crash never leaves a truncated file."""
         path = self.recipe_path(recipe.id)
         path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(recipe.to_dict(), f, ensure_ascii=False, indent=2)
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, "wb") as f:
+            f.write(jsonio.dumps(recipe.to_dict(), indent=True))
+        os.replace(tmp, path)
+        self._disk_ids.add(sys.intern(recipe.id))
     
     def load_recipe(self, recipe_id: str) -> Recipe | None:
         """Load recipe from JSON file."""
@@ -120,8 +271,8 @@ class StateManager:
             return None
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                return Recipe.from_dict(json.load(f))
+            with open(path, "rb") as f:
+                return Recipe.from_dict(jsonio.loads(f.read()))
         except Exception:
             return None
     
@@ -149,19 +300,47 @@ class StateManager:
     
     def mark_discovered(self, recipe_id: str) -> None:
         """Mark recipe as discovered."""
+        recipe_id = sys.intern(recipe_id)
         self.state.discovered.add(recipe_id)
+        self._mark_dirty(recipe_id)
     
     def mark_pending(self, recipe_id: str) -> None:
         """Mark recipe as pending download."""
+        recipe_id = sys.intern(recipe_id)
         self.state.pending.add(recipe_id)
+        self._mark_dirty(recipe_id)
+    
+    def mark_discovered_many(self, recipe_ids: Iterable[str]) -> list[str]:
+        """Mark several recipes as discovered with one lock round-trip. Returns the interned IDs."""
+        recipe_ids = [sys.intern(rid) for rid in recipe_ids]
+        self.state.discovered.update(recipe_ids)
+        with self._dirty_lock:
+            self._dirty.update(recipe_ids)
+        return recipe_ids
+    
+    def mark_pending_many(self, recipe_ids: Iterable[str]) -> None:
+        """Mark several recipes as pending download with one lock round-trip."""
+        recipe_ids = [sys.intern(rid) for rid in recipe_ids]
+        self.state.pending.update(recipe_ids)
+        with self._dirty_lock:
+            self._dirty.update(recipe_ids)
     
     def mark_completed(self, recipe_id: str) -> None:
         """Mark recipe as successfully downloaded."""
+        recipe_id = sys.intern(recipe_id)
         self.state.completed.add(recipe_id)
         self.state.pending.discard(recipe_id)
         self.state.failed.discard(recipe_id)
+        self._record_outcome(recipe_id)
     
     def mark_failed(self, recipe_id: str) -> None:
         """Mark recipe as failed."""
+        recipe_id = sys.intern(recipe_id)
         self.state.failed.add(recipe_id)
         self.state.pending.discard(recipe_id)
+        self._record_outcome(recipe_id)
+    
+    def _mark_dirty(self, recipe_id: str) -> None:
+        """Queue recipe for the next incremental save."""
+        with self._dirty_lock:
+            self._dirty.add(recipe_id)